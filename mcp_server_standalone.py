@@ -54,6 +54,7 @@ for logger_name in ["scholarly", "paperscraper", "mcp", "urllib3", "requests", "
 
 # Now import everything else
 import asyncio
+import atexit
 import json
 import tempfile
 from typing import Any, Dict, List, Optional, Sequence
@@ -70,9 +71,7 @@ from mcp.types import (
     LoggingLevel
 )
 
-# Add paperscraper to path and import
-sys.path.insert(0, '/Users/matthiasflo/Documents/paperscraper')
-
+# Import paperscraper (requires an installation, e.g. `pip install -e .`)
 from paperscraper.pubmed import get_and_dump_pubmed_papers
 from paperscraper.arxiv import get_and_dump_arxiv_papers
 from paperscraper.scholar import get_and_dump_scholar_papers
@@ -86,6 +85,22 @@ from paperscraper.load_dumps import QUERY_FN_DICT
 
 logger = logging.getLogger("paperscraper-mcp")
 
+# One reusable scratch file per tool instead of creating/unlinking one per call
+_TMP_POOL: Dict[str, str] = {}
+
+def _temp_file(name: str) -> str:
+    """Get the scratch .jsonl file reserved for `name`, creating it on first use."""
+    if name not in _TMP_POOL:
+        fd, _TMP_POOL[name] = tempfile.mkstemp(suffix='.jsonl')
+        os.close(fd)
+    return _TMP_POOL[name]
+
+@atexit.register
+def _cleanup_temp_files() -> None:
+    for path in _TMP_POOL.values():
+        if os.path.exists(path):
+            os.unlink(path)
+
 # Initialize the MCP server
 server = Server("paperscraper")
 
@@ -310,104 +325,86 @@ async def search_pubmed(arguments: Dict[str, Any]) -> List[TextContent]:
     query = arguments["query"]
     max_results = arguments.get("max_results", 100)
     
-    with tempfile.NamedTemporaryFile(mode='w+', suffix='.jsonl', delete=False) as f:
-        temp_file = f.name
+    temp_file = _temp_file("search_pubmed")
     
-    try:
-        get_and_dump_pubmed_papers(
-            query, 
-            output_filepath=temp_file,
-            retmax=max_results
-        )
+    get_and_dump_pubmed_papers(
+        query, 
+        output_filepath=temp_file,
+        retmax=max_results
+    )
+    
+    results = load_jsonl(temp_file)
+    
+    response = f"Found {len(results)} papers in PubMed\n\n"
+    for i, paper in enumerate(results[:10]):  # Show first 10
+        response += f"{i+1}. {paper.get('title', 'No title')}\n"
+        response += f"   Authors: {paper.get('authors', 'Unknown')}\n"
+        response += f"   Journal: {paper.get('journal', 'Unknown')}\n"
+        response += f"   Year: {paper.get('date', 'Unknown')}\n"
+        if paper.get('doi'):
+            response += f"   DOI: {paper['doi']}\n"
+        response += "\n"
         
-        results = load_jsonl(temp_file)
+    if len(results) > 10:
+        response += f"... and {len(results) - 10} more results\n"
         
-        response = f"Found {len(results)} papers in PubMed\n\n"
-        for i, paper in enumerate(results[:10]):  # Show first 10
-            response += f"{i+1}. {paper.get('title', 'No title')}\n"
-            response += f"   Authors: {paper.get('authors', 'Unknown')}\n"
-            response += f"   Journal: {paper.get('journal', 'Unknown')}\n"
-            response += f"   Year: {paper.get('date', 'Unknown')}\n"
-            if paper.get('doi'):
-                response += f"   DOI: {paper['doi']}\n"
-            response += "\n"
-            
-        if len(results) > 10:
-            response += f"... and {len(results) - 10} more results\n"
-            
-        return [TextContent(type="text", text=response)]
-        
-    finally:
-        if os.path.exists(temp_file):
-            os.unlink(temp_file)
+    return [TextContent(type="text", text=response)]
 
 async def search_arxiv(arguments: Dict[str, Any]) -> List[TextContent]:
     """Search arXiv for papers."""
     query = arguments["query"]
     max_results = arguments.get("max_results", 100)
     
-    with tempfile.NamedTemporaryFile(mode='w+', suffix='.jsonl', delete=False) as f:
-        temp_file = f.name
+    temp_file = _temp_file("search_arxiv")
     
-    try:
-        get_and_dump_arxiv_papers(
-            query, 
-            output_filepath=temp_file,
-            max_results=max_results
-        )
-        
-        results = load_jsonl(temp_file)
+    get_and_dump_arxiv_papers(
+        query, 
+        output_filepath=temp_file,
+        max_results=max_results
+    )
+    
+    results = load_jsonl(temp_file)
+    
+    response = f"Found {len(results)} papers in arXiv\n\n"
+    for i, paper in enumerate(results[:10]):
+        response += f"{i+1}. {paper.get('title', 'No title')}\n"
+        response += f"   Authors: {paper.get('authors', 'Unknown')}\n"
+        response += f"   Published: {paper.get('date', 'Unknown')}\n"
+        if paper.get('doi'):
+            response += f"   DOI: {paper['doi']}\n"
+        if paper.get('url'):
+            response += f"   URL: {paper['url']}\n"
+        response += "\n"
         
-        response = f"Found {len(results)} papers in arXiv\n\n"
-        for i, paper in enumerate(results[:10]):
-            response += f"{i+1}. {paper.get('title', 'No title')}\n"
-            response += f"   Authors: {paper.get('authors', 'Unknown')}\n"
-            response += f"   Published: {paper.get('date', 'Unknown')}\n"
-            if paper.get('doi'):
-                response += f"   DOI: {paper['doi']}\n"
-            if paper.get('url'):
-                response += f"   URL: {paper['url']}\n"
-            response += "\n"
-            
-        if len(results) > 10:
-            response += f"... and {len(results) - 10} more results\n"
-            
-        return [TextContent(type="text", text=response)]
+    if len(results) > 10:
+        response += f"... and {len(results) - 10} more results\n"
         
-    finally:
-        if os.path.exists(temp_file):
-            os.unlink(temp_file)
+    return [TextContent(type="text", text=response)]
 
 async def search_scholar(arguments: Dict[str, Any]) -> List[TextContent]:
     """Search Google Scholar for papers."""
     topic = arguments["topic"]
     max_results = arguments.get("max_results", 50)
     
-    with tempfile.NamedTemporaryFile(mode='w+', suffix='.jsonl', delete=False) as f:
-        temp_file = f.name
+    temp_file = _temp_file("search_scholar")
     
-    try:
-        get_and_dump_scholar_papers(topic, output_filepath=temp_file)
-        
-        results = load_jsonl(temp_file)
+    get_and_dump_scholar_papers(topic, output_filepath=temp_file)
+    
+    results = load_jsonl(temp_file)
+    
+    response = f"Found {len(results)} papers in Google Scholar\n\n"
+    for i, paper in enumerate(results[:10]):
+        response += f"{i+1}. {paper.get('title', 'No title')}\n"
+        response += f"   Authors: {paper.get('authors', 'Unknown')}\n"
+        response += f"   Year: {paper.get('date', 'Unknown')}\n"
+        if paper.get('citations'):
+            response += f"   Citations: {paper['citations']}\n"
+        response += "\n"
         
-        response = f"Found {len(results)} papers in Google Scholar\n\n"
-        for i, paper in enumerate(results[:10]):
-            response += f"{i+1}. {paper.get('title', 'No title')}\n"
-            response += f"   Authors: {paper.get('authors', 'Unknown')}\n"
-            response += f"   Year: {paper.get('date', 'Unknown')}\n"
-            if paper.get('citations'):
-                response += f"   Citations: {paper['citations']}\n"
-            response += "\n"
-            
-        if len(results) > 10:
-            response += f"... and {len(results) - 10} more results\n"
-            
-        return [TextContent(type="text", text=response)]
+    if len(results) > 10:
+        response += f"... and {len(results) - 10} more results\n"
         
-    finally:
-        if os.path.exists(temp_file):
-            os.unlink(temp_file)
+    return [TextContent(type="text", text=response)]
 
 async def search_preprint_servers(arguments: Dict[str, Any]) -> List[TextContent]:
     """Search preprint servers."""
@@ -419,26 +416,20 @@ async def search_preprint_servers(arguments: Dict[str, Any]) -> List[TextContent
     
     for server in servers:
         if server in QUERY_FN_DICT:
-            with tempfile.NamedTemporaryFile(mode='w+', suffix='.jsonl', delete=False) as f:
-                temp_file = f.name
+            temp_file = _temp_file(f"preprint_{server}")
             
-            try:
-                QUERY_FN_DICT[server](query, output_filepath=temp_file)
-                results = load_jsonl(temp_file)
-                all_results.extend(results)
-                
-                response += f"\n{server.upper()}: Found {len(results)} papers\n"
-                for i, paper in enumerate(results[:5]):  # Show first 5 per server
-                    response += f"  {i+1}. {paper.get('title', 'No title')}\n"
-                    response += f"     Authors: {paper.get('authors', 'Unknown')}\n"
-                    response += f"     Date: {paper.get('date', 'Unknown')}\n"
-                    if paper.get('doi'):
-                        response += f"     DOI: {paper['doi']}\n"
-                    response += "\n"
-                    
-            finally:
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
+            QUERY_FN_DICT[server](query, output_filepath=temp_file)
+            results = load_jsonl(temp_file)
+            all_results.extend(results)
+            
+            response += f"\n{server.upper()}: Found {len(results)} papers\n"
+            for i, paper in enumerate(results[:5]):  # Show first 5 per server
+                response += f"  {i+1}. {paper.get('title', 'No title')}\n"
+                response += f"     Authors: {paper.get('authors', 'Unknown')}\n"
+                response += f"     Date: {paper.get('date', 'Unknown')}\n"
+                if paper.get('doi'):
+                    response += f"     DOI: {paper['doi']}\n"
+                response += "\n"
     
     total_response = f"Total papers found across {len(servers)} servers: {len(all_results)}\n" + response
     return [TextContent(type="text", text=total_response)]
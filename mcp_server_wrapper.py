@@ -4,27 +4,11 @@ MCP Server Wrapper for Paperscraper
 This wrapper ensures complete isolation of stdout for JSON-RPC communication.
 """
 
+import contextlib
 import os
 import sys
 
-# Create a null output class
-class NullWriter:
-    def write(self, msg):
-        pass
-    def flush(self):
-        pass
-    def fileno(self):
-        return -1
-    @property
-    def buffer(self):
-        return self
-
 _original_stderr = sys.stderr
-_original_stdout = sys.stdout
-
-# Redirect ALL output to null temporarily
-sys.stdout = NullWriter()
-sys.stderr = sys.stderr  # Keep stderr for debugging
 
 # Set environment variables before ANY imports
 os.environ['PAPERSCRAPER_MCP_MODE'] = '1'
@@ -35,20 +19,22 @@ import warnings
 warnings.filterwarnings('ignore')
 warnings.simplefilter('ignore')
 
+# Discards stdout during the import. Never closed, since logging handlers created
+# meanwhile keep writing to it for the life of the process
+_devnull = open(os.devnull, "w")
+
 # Now import the MCP server module
 try:
-    # Import and run the main function
-    from paperscraper.mcp_server import main
-    import asyncio
-    
-    # Restore stderr for error messages
-    sys.stderr = _original_stderr
+    # Discard anything printed to stdout while the heavy dependencies load
+    with contextlib.redirect_stdout(_devnull):
+        from paperscraper import mcp_server
     
-    # Restore stdout for JSON-RPC
-    sys.stdout = _original_stdout
+    # The server captured the redirected stream as its original stdout,
+    # point it back to the real one for JSON-RPC
+    mcp_server.original_stdout = sys.stdout
     
     # Run the server
-    asyncio.run(main())
+    mcp_server.run(mcp_server.main())
     
 except KeyboardInterrupt:
     pass
@@ -56,4 +42,4 @@ except Exception as e:
     # Restore stderr to report errors
     sys.stderr = _original_stderr
     print(f"Fatal error: {e}", file=sys.stderr)
-    sys.exit(1)
\ No newline at end of file
+    sys.exit(1)
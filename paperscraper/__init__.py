@@ -8,16 +8,6 @@ import os
 import sys
 from typing import List, Union
 
-# Check if we're in MCP mode before importing load_dumps
-# In MCP mode, delay load_dumps import to avoid stdout warnings
-# import sys
-# print(f"DEBUG __init__.py: MCP mode = {os.environ.get('PAPERSCRAPER_MCP_MODE')}", file=sys.stderr)
-
-if not os.environ.get('PAPERSCRAPER_MCP_MODE'):
-    from .load_dumps import QUERY_FN_DICT
-else:
-    # In MCP mode, defer the import and create a lazy loader
-    QUERY_FN_DICT = None
 from .utils import get_filename_from_query
 
 logging.basicConfig(stream=sys.stdout, level=logging.WARNING)
@@ -31,6 +21,20 @@ arxiv_logger = logging.getLogger("arxiv")
 arxiv_logger.setLevel(logging.WARNING)
 
 
+def __getattr__(name: str):
+    """Lazily load the query functions on first access (PEP 562).
+
+    Loading the dumps pulls in pandas and the arxiv/pubmed clients, so this is
+    deferred until `QUERY_FN_DICT` is actually needed.
+    """
+    if name == "QUERY_FN_DICT":
+        from .load_dumps import QUERY_FN_DICT
+
+        globals()["QUERY_FN_DICT"] = QUERY_FN_DICT
+        return QUERY_FN_DICT
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def dump_queries(keywords: List[List[Union[str, List[str]]]], dump_root: str) -> None:
     """Performs keyword search on all available servers and dump the results.
 
@@ -42,11 +46,7 @@ def dump_queries(keywords: List[List[Union[str, List[str]]]], dump_root: str) ->
             (OR separated).
         dump_root (str): Path to root for dumping.
     """
-    global QUERY_FN_DICT
-    
-    # Import QUERY_FN_DICT if not already available (MCP mode)
-    if QUERY_FN_DICT is None:
-        from .load_dumps import QUERY_FN_DICT
+    from .load_dumps import QUERY_FN_DICT
 
     for idx, keyword in enumerate(keywords):
         for db, f in QUERY_FN_DICT.items():
@@ -2,21 +2,21 @@ import glob
 import logging
 import os
 import sys
+from importlib.resources import files
 from typing import Dict, List, Literal, Union
 
 import arxiv
 import pandas as pd
-import pkg_resources
 from tqdm import tqdm
 
 from ..utils import dump_papers
-from ..xrxiv.xrxiv_query import XRXivQuery
+from ..xrxiv.xrxiv_query import XRXivQuery, select_dump
 from .utils import get_query_from_keywords, infer_backend
 
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-dump_root = pkg_resources.resource_filename("paperscraper", "server_dumps")
+dump_root = str(files("paperscraper") / "server_dumps")
 
 global ARXIV_QUERIER
 ARXIV_QUERIER = None
@@ -26,10 +26,9 @@ def search_local_arxiv():
     global ARXIV_QUERIER
     if ARXIV_QUERIER is not None:
         return
-    dump_paths = glob.glob(os.path.join(dump_root, "arxiv*"))
+    path = select_dump(glob.glob(os.path.join(dump_root, "arxiv*")))
 
-    if len(dump_paths) > 0:
-        path = sorted(dump_paths, reverse=True)[0]
+    if path is not None:
         querier = XRXivQuery(path)
         if not querier.errored:
             ARXIV_QUERIER = querier.search_keywords
@@ -1,9 +1,10 @@
 import glob
 import os
 from datetime import datetime
+from importlib.resources import files
 from typing import List, Union
 
-import pkg_resources
+from ..xrxiv.xrxiv_query import select_dump
 
 finalize_disjunction = lambda x: "(" + x[:-4] + ") AND "
 finalize_conjunction = lambda x: x[:-5]
@@ -59,6 +60,6 @@ def get_query_from_keywords(
 
 
 def infer_backend():
-    dump_root = pkg_resources.resource_filename("paperscraper", "server_dumps")
-    dump_paths = glob.glob(os.path.join(dump_root, "arxiv" + "*"))
-    return "api" if not dump_paths else "local"
+    dump_root = str(files("paperscraper") / "server_dumps")
+    dump_path = select_dump(glob.glob(os.path.join(dump_root, "arxiv" + "*")))
+    return "api" if dump_path is None else "local"
@@ -3,15 +3,16 @@
 import json
 import os
 from datetime import datetime, timedelta
+from importlib.resources import files
 from typing import Optional
 
-import pkg_resources
 from tqdm import tqdm
 
 from ..arxiv import get_arxiv_papers_api
+from .utils.parquet import convert_to_parquet
 
 today = datetime.today().strftime("%Y-%m-%d")
-save_folder = pkg_resources.resource_filename("paperscraper", "server_dumps")
+save_folder = str(files("paperscraper") / "server_dumps")
 save_path = os.path.join(save_folder, f"arxiv_{today}.jsonl")
 
 
@@ -72,3 +73,6 @@ def arxiv(
                 print(f"Arxiv scraping error: {current_date.strftime('%Y-%m-%d')}: {e}")
             current_date = next_date
             progress_bar.update(1)
+
+    # Columnar copy for faster loading
+    convert_to_parquet(save_path)
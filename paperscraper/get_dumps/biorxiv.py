@@ -3,16 +3,17 @@
 import json
 import os
 from datetime import datetime
+from importlib.resources import files
 from typing import Optional
 
-import pkg_resources
 from tqdm import tqdm
 
 from ..xrxiv.xrxiv_api import BioRxivApi
+from .utils.parquet import convert_to_parquet
 
 today = datetime.today().strftime("%Y-%m-%d")
 save_path = os.path.join(
-    pkg_resources.resource_filename("paperscraper", "server_dumps"),
+    str(files("paperscraper") / "server_dumps"),
     f"biorxiv_{today}.jsonl",
 )
 
@@ -49,3 +50,6 @@ def biorxiv(
             if index > 0:
                 fp.write(os.linesep)
             fp.write(json.dumps(paper))
+
+    # Columnar copy for faster loading
+    convert_to_parquet(save_path)
@@ -4,17 +4,17 @@ import logging
 import os
 import sys
 from datetime import datetime
+from importlib.resources import files
 from typing import Optional
 
-import pkg_resources
-
 from .utils.chemrxiv import ChemrxivAPI, download_full, parse_dump
+from .utils.parquet import convert_to_parquet
 
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 today = datetime.today().strftime("%Y-%m-%d")
-save_folder = pkg_resources.resource_filename("paperscraper", "server_dumps")
+save_folder = str(files("paperscraper") / "server_dumps")
 save_path = os.path.join(save_folder, f"chemrxiv_{today}.jsonl")
 
 
@@ -43,3 +43,5 @@ def chemrxiv(
     download_full(save_folder, api)
     # Convert to JSONL format.
     parse_dump(save_folder, save_path)
+    # Columnar copy for faster loading
+    convert_to_parquet(save_path)
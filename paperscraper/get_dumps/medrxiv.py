@@ -3,15 +3,16 @@
 import json
 import os
 from datetime import datetime
+from importlib.resources import files
 from typing import Optional
 
-import pkg_resources
 from tqdm import tqdm
 
 from ..xrxiv.xrxiv_api import MedRxivApi
+from .utils.parquet import convert_to_parquet
 
 today = datetime.today().strftime("%Y-%m-%d")
-save_folder = pkg_resources.resource_filename("paperscraper", "server_dumps")
+save_folder = str(files("paperscraper") / "server_dumps")
 save_path = os.path.join(save_folder, f"medrxiv_{today}.jsonl")
 
 
@@ -46,3 +47,6 @@ def medrxiv(
             if index > 0:
                 fp.write(os.linesep)
             fp.write(json.dumps(paper))
+
+    # Columnar copy for faster loading
+    convert_to_parquet(save_path)
@@ -0,0 +1,44 @@
+"""Convert JSONL dumps to Parquet for faster loading."""
+
+import logging
+import os
+import sys
+from typing import Optional
+
+import pandas as pd
+
+logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def convert_to_parquet(dump_filepath: str) -> Optional[str]:
+    """
+    Write a Parquet copy next to a JSONL dump, e.g. `biorxiv_2024-01-01.parquet`
+    for `biorxiv_2024-01-01.jsonl`. Dumps are then loaded from the Parquet file,
+    which is columnar and compressed and thus much faster to read.
+
+    Args:
+        dump_filepath (str): Path to a `.jsonl` dump.
+
+    Returns:
+        Optional[str]: Path to the Parquet file or None if it could not be written,
+            e.g. because `pyarrow` is not installed.
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        logger.debug("pyarrow is not installed, keeping only the JSONL dump.")
+        return None
+    if not os.path.exists(dump_filepath) or os.path.getsize(dump_filepath) == 0:
+        return None
+
+    parquet_filepath = os.path.splitext(dump_filepath)[0] + ".parquet"
+    try:
+        df = pd.read_json(dump_filepath, lines=True)
+        df.to_parquet(parquet_filepath, engine="pyarrow", index=False)
+    except (ValueError, pyarrow.ArrowException) as e:
+        logger.warning(f"Could not convert {dump_filepath} to Parquet: {e}")
+        if os.path.exists(parquet_filepath):
+            os.remove(parquet_filepath)
+        return None
+    return parquet_filepath
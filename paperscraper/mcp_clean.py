@@ -14,9 +14,6 @@ os.environ['PYTHONWARNINGS'] = 'ignore'
 import warnings
 warnings.filterwarnings('ignore')
 warnings.simplefilter('ignore')
-# Specifically ignore pkg_resources deprecation warning
-warnings.filterwarnings('ignore', category=DeprecationWarning)
-warnings.filterwarnings('ignore', message='pkg_resources is deprecated')
 
 # Configure logging before imports
 import logging
@@ -52,9 +52,11 @@ for logger_name in ["scholarly", "paperscraper", "mcp", "urllib3", "requests", "
 
 # Now import everything else
 import asyncio
+import functools
 import json
 import tempfile
-from typing import Any, Dict, List, Optional, Sequence
+import time
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, List, Optional, Sequence, Tuple
 
 from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
@@ -75,14 +77,14 @@ import importlib.util
 # Import paperscraper modules
 from paperscraper.pubmed import get_and_dump_pubmed_papers
 from paperscraper.arxiv import get_and_dump_arxiv_papers
-from paperscraper.scholar import get_and_dump_scholar_papers
 from paperscraper.xrxiv.xrxiv_query import XRXivQuery
-from paperscraper.citations import get_citations_from_title, get_citations_by_doi
-from paperscraper.impact import Impactor
-from paperscraper.pdf import save_pdf, save_pdf_from_dump
-from paperscraper.utils import load_jsonl
+from paperscraper.utils import DictSink
 from paperscraper.get_dumps import biorxiv, medrxiv, chemrxiv
 from paperscraper.load_dumps import QUERY_FN_DICT
+# scholar, citations, impact and pdf are slow to import and only needed by their
+# own tools, so they are imported on the first call of that tool
+if TYPE_CHECKING:
+    from paperscraper.impact import Impactor
 
 # load_dumps_module was imported directly with MCP mode, so no logger override needed
 
@@ -91,6 +93,23 @@ logger = logging.getLogger("paperscraper-mcp")
 # Initialize the MCP server
 server = Server("paperscraper")
 
+# Preprint search results keyed on (server, query); the dumps only change on restart
+_RESULTS_CACHE: Dict[Tuple[str, Tuple], Tuple[float, List[Dict[str, Any]]]] = {}
+_RESULTS_CACHE_TTL = 600  # seconds
+
+def _freeze(query: Any) -> Any:
+    """Recursively convert lists to tuples so a query can be used as a dict key."""
+    if isinstance(query, list):
+        return tuple(_freeze(item) for item in query)
+    return query
+
+@functools.lru_cache(maxsize=1)
+def _impactor() -> "Impactor":
+    """Shared Impactor, so the journal table is only loaded once per process."""
+    from paperscraper.impact import Impactor
+
+    return Impactor()
+
 @server.list_tools()
 async def handle_list_tools() -> List[Tool]:
     """List available paperscraper tools."""
@@ -284,24 +303,10 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
     """Handle tool calls."""
     
     try:
-        if name == "search_pubmed":
-            return await search_pubmed(arguments)
-        elif name == "search_arxiv":
-            return await search_arxiv(arguments)
-        elif name == "search_scholar":
-            return await search_scholar(arguments)
-        elif name == "search_preprint_servers":
-            return await search_preprint_servers(arguments)
-        elif name == "get_citations":
-            return await get_citations(arguments)
-        elif name == "search_journal_impact":
-            return await search_journal_impact(arguments)
-        elif name == "download_paper_pdf":
-            return await download_paper_pdf(arguments)
-        elif name == "update_preprint_dumps":
-            return await update_preprint_dumps(arguments)
-        else:
+        handler = _TOOLS.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
+        return await handler(arguments)
             
     except Exception as e:
         logger.error(f"Error in {name}: {str(e)}")
@@ -312,138 +317,143 @@ async def search_pubmed(arguments: Dict[str, Any]) -> List[TextContent]:
     query = arguments["query"]
     max_results = arguments.get("max_results", 100)
     
-    with tempfile.NamedTemporaryFile(mode='w+', suffix='.jsonl', delete=False) as f:
-        temp_file = f.name
+    sink = DictSink(limit=10)  # Only the first 10 papers are shown
+    # Run the blocking HTTP paging off the event loop
+    await asyncio.to_thread(
+        get_and_dump_pubmed_papers,
+        query,
+        output_filepath=sink,
+        max_results=max_results
+    )
+    results = sink.items
     
-    try:
-        get_and_dump_pubmed_papers(
-            query, 
-            output_filepath=temp_file,
-            max_results=max_results
-        )
+    parts: List[str] = [f"Found {len(sink)} papers in PubMed\n\n"]
+    for i, paper in enumerate(results):
+        parts.append(f"{i+1}. {paper.get('title', 'No title')}\n")
+        parts.append(f"   Authors: {paper.get('authors', 'Unknown')}\n")
+        parts.append(f"   Journal: {paper.get('journal', 'Unknown')}\n")
+        parts.append(f"   Year: {paper.get('date', 'Unknown')}\n")
+        if paper.get('doi'):
+            parts.append(f"   DOI: {paper['doi']}\n")
+        parts.append("\n")
         
-        results = load_jsonl(temp_file)
+    if len(sink) > len(results):
+        parts.append(f"... and {len(sink) - len(results)} more results\n")
         
-        response = f"Found {len(results)} papers in PubMed\n\n"
-        for i, paper in enumerate(results[:10]):  # Show first 10
-            response += f"{i+1}. {paper.get('title', 'No title')}\n"
-            response += f"   Authors: {paper.get('authors', 'Unknown')}\n"
-            response += f"   Journal: {paper.get('journal', 'Unknown')}\n"
-            response += f"   Year: {paper.get('date', 'Unknown')}\n"
-            if paper.get('doi'):
-                response += f"   DOI: {paper['doi']}\n"
-            response += "\n"
-            
-        if len(results) > 10:
-            response += f"... and {len(results) - 10} more results\n"
-            
-        return [TextContent(type="text", text=response)]
-        
-    finally:
-        if os.path.exists(temp_file):
-            os.unlink(temp_file)
+    return [TextContent(type="text", text="".join(parts))]
 
 async def search_arxiv(arguments: Dict[str, Any]) -> List[TextContent]:
     """Search arXiv for papers."""
     query = arguments["query"]
     max_results = arguments.get("max_results", 100)
     
-    with tempfile.NamedTemporaryFile(mode='w+', suffix='.jsonl', delete=False) as f:
-        temp_file = f.name
+    sink = DictSink(limit=10)
+    # Run the blocking HTTP paging off the event loop
+    await asyncio.to_thread(
+        get_and_dump_arxiv_papers,
+        query,
+        output_filepath=sink,
+        max_results=max_results
+    )
+    results = sink.items
     
-    try:
-        get_and_dump_arxiv_papers(
-            query, 
-            output_filepath=temp_file,
-            max_results=max_results
-        )
+    parts: List[str] = [f"Found {len(sink)} papers in arXiv\n\n"]
+    for i, paper in enumerate(results):
+        parts.append(f"{i+1}. {paper.get('title', 'No title')}\n")
+        parts.append(f"   Authors: {paper.get('authors', 'Unknown')}\n")
+        parts.append(f"   Published: {paper.get('date', 'Unknown')}\n")
+        if paper.get('doi'):
+            parts.append(f"   DOI: {paper['doi']}\n")
+        if paper.get('url'):
+            parts.append(f"   URL: {paper['url']}\n")
+        parts.append("\n")
         
-        results = load_jsonl(temp_file)
+    if len(sink) > len(results):
+        parts.append(f"... and {len(sink) - len(results)} more results\n")
         
-        response = f"Found {len(results)} papers in arXiv\n\n"
-        for i, paper in enumerate(results[:10]):
-            response += f"{i+1}. {paper.get('title', 'No title')}\n"
-            response += f"   Authors: {paper.get('authors', 'Unknown')}\n"
-            response += f"   Published: {paper.get('date', 'Unknown')}\n"
-            if paper.get('doi'):
-                response += f"   DOI: {paper['doi']}\n"
-            if paper.get('url'):
-                response += f"   URL: {paper['url']}\n"
-            response += "\n"
-            
-        if len(results) > 10:
-            response += f"... and {len(results) - 10} more results\n"
-            
-        return [TextContent(type="text", text=response)]
-        
-    finally:
-        if os.path.exists(temp_file):
-            os.unlink(temp_file)
+    return [TextContent(type="text", text="".join(parts))]
 
 async def search_scholar(arguments: Dict[str, Any]) -> List[TextContent]:
     """Search Google Scholar for papers."""
     topic = arguments["topic"]
     max_results = arguments.get("max_results", 50)
     
-    with tempfile.NamedTemporaryFile(mode='w+', suffix='.jsonl', delete=False) as f:
-        temp_file = f.name
+    from paperscraper.scholar import get_and_dump_scholar_papers
+
+    sink = DictSink(limit=10)
+    get_and_dump_scholar_papers(topic, output_filepath=sink)
+    results = sink.items
     
-    try:
-        get_and_dump_scholar_papers(topic, output_filepath=temp_file)
-        
-        results = load_jsonl(temp_file)
+    parts: List[str] = [f"Found {len(sink)} papers in Google Scholar\n\n"]
+    for i, paper in enumerate(results):
+        parts.append(f"{i+1}. {paper.get('title', 'No title')}\n")
+        parts.append(f"   Authors: {paper.get('authors', 'Unknown')}\n")
+        parts.append(f"   Year: {paper.get('date', 'Unknown')}\n")
+        if paper.get('citations'):
+            parts.append(f"   Citations: {paper['citations']}\n")
+        parts.append("\n")
         
-        response = f"Found {len(results)} papers in Google Scholar\n\n"
-        for i, paper in enumerate(results[:10]):
-            response += f"{i+1}. {paper.get('title', 'No title')}\n"
-            response += f"   Authors: {paper.get('authors', 'Unknown')}\n"
-            response += f"   Year: {paper.get('date', 'Unknown')}\n"
-            if paper.get('citations'):
-                response += f"   Citations: {paper['citations']}\n"
-            response += "\n"
-            
-        if len(results) > 10:
-            response += f"... and {len(results) - 10} more results\n"
-            
-        return [TextContent(type="text", text=response)]
+    if len(sink) > len(results):
+        parts.append(f"... and {len(sink) - len(results)} more results\n")
         
-    finally:
-        if os.path.exists(temp_file):
-            os.unlink(temp_file)
+    return [TextContent(type="text", text="".join(parts))]
+
+def _search_preprint_server(server: str, query: List[List[str]]) -> List[Dict[str, Any]]:
+    """Run a blocking keyword search against a single preprint dump."""
+    key = (server, _freeze(query))
+    now = time.monotonic()
+    cached = _RESULTS_CACHE.get(key)
+    if cached is not None and now - cached[0] < _RESULTS_CACHE_TTL:
+        return cached[1]
+
+    sink = DictSink()
+    QUERY_FN_DICT[server](query, output_filepath=sink)
+    sink.flush()
+
+    # Snapshot the items since other servers are searched concurrently in threads
+    for stale in [k for k, (t, _) in list(_RESULTS_CACHE.items()) if now - t >= _RESULTS_CACHE_TTL]:
+        _RESULTS_CACHE.pop(stale, None)
+    _RESULTS_CACHE[key] = (now, sink.items)
+    return sink.items
 
 async def search_preprint_servers(arguments: Dict[str, Any]) -> List[TextContent]:
     """Search preprint servers."""
     query = arguments["query"]
     servers = arguments.get("servers", ["biorxiv", "medrxiv", "chemrxiv"])
-    
+    available = [server for server in servers if server in QUERY_FN_DICT]
+
+    # Query all dumps concurrently; wall time is bounded by the slowest server
+    results_per_server = await asyncio.gather(
+        *(asyncio.to_thread(_search_preprint_server, server, query) for server in available)
+    )
+
     all_results = []
-    response = ""
-    
-    for server in servers:
-        if server in QUERY_FN_DICT:
-            with tempfile.NamedTemporaryFile(mode='w+', suffix='.jsonl', delete=False) as f:
-                temp_file = f.name
-            
-            try:
-                QUERY_FN_DICT[server](query, output_filepath=temp_file)
-                results = load_jsonl(temp_file)
-                all_results.extend(results)
-                
-                response += f"\n{server.upper()}: Found {len(results)} papers\n"
-                for i, paper in enumerate(results[:5]):  # Show first 5 per server
-                    response += f"  {i+1}. {paper.get('title', 'No title')}\n"
-                    response += f"     Authors: {paper.get('authors', 'Unknown')}\n"
-                    response += f"     Date: {paper.get('date', 'Unknown')}\n"
-                    if paper.get('doi'):
-                        response += f"     DOI: {paper['doi']}\n"
-                    response += "\n"
-                    
-            finally:
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
+    parts: List[str] = []
+    seen = set()
+
+    for server, results in zip(available, results_per_server):
+        # Papers cross-posted to several servers are only listed once, keyed by
+        # DOI or, lacking one, by lowercased title
+        unique = []
+        for paper in results:
+            key = paper.get('doi') or (paper.get('title') or '').lower()
+            if key and key in seen:
+                continue
+            seen.add(key)
+            unique.append(paper)
+        all_results.extend(unique)
+
+        parts.append(f"\n{server.upper()}: Found {len(results)} papers\n")
+        for i, paper in enumerate(unique[:5]):  # Show first 5 per server
+            parts.append(f"  {i+1}. {paper.get('title', 'No title')}\n")
+            parts.append(f"     Authors: {paper.get('authors', 'Unknown')}\n")
+            parts.append(f"     Date: {paper.get('date', 'Unknown')}\n")
+            if paper.get('doi'):
+                parts.append(f"     DOI: {paper['doi']}\n")
+            parts.append("\n")
     
-    total_response = f"Total papers found across {len(servers)} servers: {len(all_results)}\n" + response
-    return [TextContent(type="text", text=total_response)]
+    header = f"Total papers found across {len(servers)} servers: {len(all_results)}\n"
+    return [TextContent(type="text", text=header + "".join(parts))]
 
 async def get_citations(arguments: Dict[str, Any]) -> List[TextContent]:
     """Get citation count for a paper."""
@@ -451,6 +461,11 @@ async def get_citations(arguments: Dict[str, Any]) -> List[TextContent]:
     doi = arguments.get("doi")
     
     try:
+        from paperscraper.citations import (
+            get_citations_by_doi,
+            get_citations_from_title,
+        )
+
         if doi:
             citations = get_citations_by_doi(doi)
             response = f"Citations for DOI {doi}: {citations}"
@@ -473,7 +488,7 @@ async def search_journal_impact(arguments: Dict[str, Any]) -> List[TextContent]:
     max_impact = arguments.get("max_impact")
     
     try:
-        impactor = Impactor()
+        impactor = _impactor()
         
         search_args = {
             "threshold": threshold,
@@ -487,11 +502,12 @@ async def search_journal_impact(arguments: Dict[str, Any]) -> List[TextContent]:
         if not results:
             response = f"No journals found matching '{journal_name}'"
         else:
-            response = f"Found {len(results)} journal(s) matching '{journal_name}':\n\n"
+            parts = [f"Found {len(results)} journal(s) matching '{journal_name}':\n\n"]
             for result in results:
-                response += f"• {result['journal']}\n"
-                response += f"  Impact Factor: {result['factor']}\n"
-                response += f"  Match Score: {result['score']}%\n\n"
+                parts.append(f"• {result['journal']}\n")
+                parts.append(f"  Impact Factor: {result['factor']}\n")
+                parts.append(f"  Match Score: {result['score']}%\n\n")
+            response = "".join(parts)
                 
         return [TextContent(type="text", text=response)]
         
@@ -504,6 +520,8 @@ async def download_paper_pdf(arguments: Dict[str, Any]) -> List[TextContent]:
     filename = arguments.get("filename", f"{doi.replace('/', '_')}.pdf")
     
     try:
+        from paperscraper.pdf import save_pdf
+
         paper_data = {"doi": doi}
         
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -523,46 +541,77 @@ async def download_paper_pdf(arguments: Dict[str, Any]) -> List[TextContent]:
     except Exception as e:
         return [TextContent(type="text", text=f"Error downloading PDF: {str(e)}")]
 
+_DUMP_FN_DICT = {"biorxiv": biorxiv, "medrxiv": medrxiv, "chemrxiv": chemrxiv}
+
+def _update_dump(server: str, **kwargs: Any) -> None:
+    """Run a blocking dump update for a single preprint server."""
+    if server not in _DUMP_FN_DICT:
+        raise ValueError(f"Unknown server: {server}")
+    _DUMP_FN_DICT[server](**kwargs)
+
 async def update_preprint_dumps(arguments: Dict[str, Any]) -> List[TextContent]:
     """Update preprint server dumps."""
     servers = arguments.get("servers", ["biorxiv", "medrxiv", "chemrxiv"])
     start_date = arguments.get("start_date")
     end_date = arguments.get("end_date")
     
-    response = "Updating preprint server dumps...\n\n"
+    kwargs = {}
+    if start_date or end_date:
+        kwargs = {"start_date": start_date, "end_date": end_date}
+
+    # Servers are rate limited independently, so the scrapes can overlap
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_update_dump, server, **kwargs) for server in servers),
+        return_exceptions=True
+    )
+
+    parts: List[str] = ["Updating preprint server dumps...\n\n"]
     
-    for server in servers:
-        try:
-            response += f"Updating {server}... "
-            
-            if server == "biorxiv":
-                if start_date or end_date:
-                    biorxiv(start_date=start_date, end_date=end_date)
-                else:
-                    biorxiv()
-            elif server == "medrxiv":
-                if start_date or end_date:
-                    medrxiv(start_date=start_date, end_date=end_date)
-                else:
-                    medrxiv()
-            elif server == "chemrxiv":
-                if start_date or end_date:
-                    chemrxiv(start_date=start_date, end_date=end_date)
-                else:
-                    chemrxiv()
-                    
-            response += "✓ Complete\n"
-            
-        except Exception as e:
-            response += f"✗ Error: {str(e)}\n"
+    for server, result in zip(servers, results):
+        parts.append(f"Updating {server}... ")
+        if isinstance(result, BaseException):
+            parts.append(f"✗ Error: {str(result)}\n")
+        else:
+            parts.append("✓ Complete\n")
     
-    response += "\nDump update process finished. Please restart to use updated dumps."
-    return [TextContent(type="text", text=response)]
+    parts.append("\nDump update process finished. Please restart to use updated dumps.")
+    return [TextContent(type="text", text="".join(parts))]
+
+# Tool name -> handler, looked up by handle_call_tool
+_TOOLS = {
+    "search_pubmed": search_pubmed,
+    "search_arxiv": search_arxiv,
+    "search_scholar": search_scholar,
+    "search_preprint_servers": search_preprint_servers,
+    "get_citations": get_citations,
+    "search_journal_impact": search_journal_impact,
+    "download_paper_pdf": download_paper_pdf,
+    "update_preprint_dumps": update_preprint_dumps,
+}
+
+def run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine on the libuv-based uvloop event loop if it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    # A new loop per run; uvloop.install() is deprecated from Python 3.12 on
+    return uvloop.run(coro)
+
+def _warm_indexes() -> None:
+    """Start building the keyword indexes of the loaded preprint dumps."""
+    for search in QUERY_FN_DICT.values():
+        querier = getattr(search, "__self__", None)
+        if isinstance(querier, XRXivQuery):
+            querier.build_index(background=True)
 
 async def main():
     """Run the MCP server."""
     # Restore stdout for MCP JSON-RPC communication
     sys.stdout = original_stdout
+
+    # Index the dumps off the request path, searches scan until an index is ready
+    _warm_indexes()
     
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
@@ -581,6 +630,6 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         pass
\ No newline at end of file
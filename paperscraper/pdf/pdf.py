@@ -25,6 +25,8 @@ ABSTRACT_ATTRIBUTE = {
     "chemrxiv": ["citation_abstract"],
 }
 DEFAULT_ATTRIBUTES = ["citation_abstract", "description"]
+# Read/write PDFs in 1 MiB blocks to keep per-chunk Python overhead low
+PDF_CHUNK_SIZE = 1 << 20
 
 
 def save_pdf(
@@ -32,6 +34,7 @@ def save_pdf(
     filepath: Union[str, Path],
     save_metadata: bool = False,
     api_keys: Optional[Union[str, Dict[str, str]]] = None,
+    chunk_size: int = PDF_CHUNK_SIZE,
 ) -> None:
     """
     Save a PDF file of a paper.
@@ -42,6 +45,7 @@ def save_pdf(
         save_metadata: A boolean indicating whether to save paper metadata as a separate json.
         api_keys: Either a dictionary containing API keys (if already loaded) or a string (path to API keys file).
                   If None, will try to load from `.env` file and if unsuccessful, skip API-based fallbacks.
+        chunk_size: Number of bytes per chunk when streaming the PDF to disk. Defaults to 1 MiB.
     """
     if not isinstance(paper_metadata, Dict):
         raise TypeError(f"paper_metadata must be a dict, not {type(paper_metadata)}.")
@@ -108,10 +112,27 @@ def save_pdf(
     if meta_pdf and meta_pdf.get("content"):
         pdf_url = meta_pdf.get("content")
         try:
-            response = requests.get(pdf_url, timeout=60)
-            response.raise_for_status()
-
-            if response.content[:4] != b"%PDF":
+            with requests.get(pdf_url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                chunks = response.iter_content(chunk_size=chunk_size)
+                first_chunk = next(chunks, b"")
+                is_pdf = first_chunk[:4] == b"%PDF"
+                if is_pdf:
+                    pdf_path = output_path.with_suffix(".pdf")
+                    # Stream into a sibling file first, so that a download failing
+                    # halfway does not leave a truncated PDF behind
+                    part_path = pdf_path.with_name(pdf_path.name + ".part")
+                    try:
+                        with open(part_path, "wb", buffering=chunk_size) as f:
+                            f.write(first_chunk)
+                            for chunk in chunks:
+                                f.write(chunk)
+                        os.replace(part_path, pdf_path)
+                    except BaseException:
+                        part_path.unlink(missing_ok=True)
+                        raise
+
+            if not is_pdf:
                 logger.warning(
                     f"The file from {url} does not appear to be a valid PDF."
                 )
@@ -125,9 +146,6 @@ def save_pdf(
                         FALLBACKS["wiley"](paper_metadata, output_path, api_keys)
                     elif api_keys and "ELSEVIER_TDM_API_KEY" in api_keys:
                         FALLBACKS["elsevier"](paper_metadata, output_path, api_keys)
-            else:
-                with open(output_path.with_suffix(".pdf"), "wb+") as f:
-                    f.write(response.content)
         except Exception as e:
             logger.warning(f"Could not download {pdf_url}: {e}")
     else:  # if no citation_pdf_url meta tag found, try other fallbacks
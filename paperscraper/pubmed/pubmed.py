@@ -1,5 +1,8 @@
 import datetime
+import itertools
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union
 
 import pandas as pd
@@ -12,6 +15,10 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 PUBMED = PubMed(tool="MyTool", email="abc@def.gh")
+# NCBI allows 3 requests per second without an API key. At most this many
+# efetch requests run at once across all searches, leaving room for esearch
+MAX_CONCURRENT_FETCHES = 2
+_FETCH_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_FETCHES)
 
 pubmed_field_mapper = {"publication_date": "date"}
 
@@ -30,6 +37,38 @@ process_fields = {
 }
 
 
+def _query_pubmed(query: str, max_results: int = 100) -> List:
+    """
+    Retrieve the articles matching a PubMed query.
+
+    Equivalent to `PUBMED.query`, but the batches of articles are fetched
+    concurrently instead of one after another. This relies on the internals of
+    `PubMed.query` (`_getArticleIds`, `_getArticles` and `chunk_size`).
+
+    Args:
+        query (str): Query to PubMed API. Needs to match PubMed API notation.
+        max_results (int): Maximal number of results retrieved from DB.
+
+    Returns:
+        List: PubMed article objects, in the order returned by the API.
+    """
+    article_ids = PUBMED._getArticleIds(query=query, max_results=max_results)
+    batches = [
+        article_ids[i : i + PUBMED.chunk_size]
+        for i in range(0, len(article_ids), PUBMED.chunk_size)
+    ]
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+        articles = executor.map(_fetch_articles, batches)
+        return list(itertools.chain.from_iterable(articles))
+
+
+def _fetch_articles(article_ids: List[str]) -> List:
+    """Fetch one batch of articles, waiting for a free request slot."""
+    with _FETCH_SLOTS:
+        return list(PUBMED._getArticles(article_ids))
+
+
 def get_pubmed_papers(
     query: str,
     fields: List = ["title", "authors", "date", "abstract", "journal", "doi"],
@@ -50,7 +89,8 @@ def get_pubmed_papers(
             to 9998, higher values likely raise problems due to PubMedAPI, see:
             https://stackoverflow.com/questions/75353091/biopython-entrez-article-limit
 
-        NOTE: *args, **kwargs are additional arguments for pubmed.query
+        NOTE: *args, **kwargs are ignored, they are only accepted for backwards
+        compatibility.
 
     Returns:
         pd.DataFrame. One paper per row.
@@ -64,7 +104,7 @@ def get_pubmed_papers(
             "To obtain more than 9,999 PubMed records, consider using EDirect that contains additional"
             "logic to batch PubMed search results automatically so that an arbitrary number can be retrieved"
         )
-    raw = list(PUBMED.query(query, max_results=max_results, *args, **kwargs))
+    raw = _query_pubmed(query, max_results=max_results)
 
     get_mails = "emails" in fields
     if get_mails:
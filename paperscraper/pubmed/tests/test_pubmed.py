@@ -1,7 +1,11 @@
 import os
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from paperscraper.pubmed import get_and_dump_pubmed_papers, get_pubmed_papers
+from paperscraper.pubmed import pubmed
 from paperscraper.pubmed.utils import get_query_from_keywords_and_date
 
 KEYWORDS = [["machine learning", "deep learning"], ["zoology"]]
@@ -34,3 +38,32 @@ class TestPubMed:
         df = get_pubmed_papers(query, fields=["doi", "title", "authors"])
         for i, r in df.iterrows():
             assert "\n" not in r.doi
+
+    def test_query_pubmed_batches(self, monkeypatch):
+        class StubPubMed:
+            chunk_size = 2
+
+            def __init__(self):
+                self.lock = threading.Lock()
+                self.active = self.peak = 0
+
+            def _getArticleIds(self, query, max_results):
+                return [f"{query}-{i}" for i in range(7)]
+
+            def _getArticles(self, article_ids):
+                with self.lock:
+                    self.active += 1
+                    self.peak = max(self.peak, self.active)
+                # Earlier batches take longer, so they finish out of order
+                time.sleep(0.01 * (10 - int(article_ids[0].split("-")[1])))
+                with self.lock:
+                    self.active -= 1
+                yield from article_ids
+
+        stub = StubPubMed()
+        monkeypatch.setattr(pubmed, "PUBMED", stub)
+        # Concurrent searches share the request slots
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(pubmed._query_pubmed, ["a", "b"]))
+        assert results == [[f"{q}-{i}" for i in range(7)] for q in ["a", "b"]]
+        assert stub.peak == pubmed.MAX_CONCURRENT_FETCHES
@@ -0,0 +1,35 @@
+import pandas as pd
+
+from paperscraper.utils import DictSink, dump_papers, load_jsonl
+
+
+class TestUtils:
+    def test_dict_sink(self):
+        sink = DictSink()
+        sink.write('{"title": "a"}\n{"title"')
+        sink.write(': "b"}\n')
+        assert [paper["title"] for paper in sink] == ["a", "b"]
+
+        sink.write('{"title": "c"}')
+        sink.flush()
+        assert len(sink) == 3
+
+    def test_dict_sink_limit(self):
+        sink = DictSink(limit=2)
+        sink.write("".join(f'{{"title": "{i}"}}\n' for i in range(5)))
+        assert len(sink) == 5
+        assert [paper["title"] for paper in sink] == ["0", "1"]
+
+    def test_dump_papers_to_sink(self):
+        sink = DictSink()
+        dump_papers(pd.DataFrame([{"title": "a"}, {"title": "b"}]), sink)
+        assert sink.items == [{"title": "a"}, {"title": "b"}]
+
+    def test_load_jsonl_with_missing_values(self, tmp_path):
+        filepath = str(tmp_path / "papers.jsonl")
+        dump_papers(pd.DataFrame([{"title": "a", "doi": None}]), filepath)
+        with open(filepath, "a") as f:
+            f.write('{"title": "b", "doi": NaN}\n')
+        papers = load_jsonl(filepath)
+        assert [paper["title"] for paper in papers] == ["a", "b"]
+        assert len(load_jsonl(filepath, limit=1)) == 1
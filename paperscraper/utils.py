@@ -1,26 +1,104 @@
 import json
 import logging
 import sys
-from typing import Dict, List
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Union
 
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def dump_papers(papers: pd.DataFrame, filepath: str) -> None:
+def _json_loads(text: str) -> Dict[str, str]:
+    """
+    Parse a single JSON document, preferring the faster `orjson` if installed.
+
+    `orjson` is strict about the JSON spec and rejects e.g. the `NaN` literals
+    that `json.dumps` emits for missing values, so those fall back to `json`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+class DictSink:
+    """
+    In-memory replacement for a `.jsonl` output file.
+
+    Every complete line written to the sink is parsed into a dictionary and
+    collected in `items`, so results can be consumed without a round-trip
+    through the filesystem.
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        """
+        Args:
+            limit (int, optional): Maximal number of papers to parse and keep in
+                `items`. Further papers are only counted. Defaults to None, i.e.
+                all papers are kept.
+        """
+        self.items: List[Dict[str, str]] = []
+        self.limit = limit
+        self.count = 0
+        self._buffer = ""
+
+    def _add(self, line: str) -> None:
+        if not line.strip():
+            return
+        self.count += 1
+        if self.limit is None or len(self.items) < self.limit:
+            self.items.append(_json_loads(line))
+
+    def write(self, text: str) -> int:
+        """
+        Receive JSONL text, possibly spanning several (or partial) lines.
+
+        Args:
+            text (str): Text to be written.
+
+        Returns:
+            int: Number of characters written.
+        """
+        *lines, self._buffer = (self._buffer + text).split("\n")
+        for line in lines:
+            self._add(line)
+        return len(text)
+
+    def flush(self) -> None:
+        """Parse any trailing line that was not terminated by a newline."""
+        self._add(self._buffer)
+        self._buffer = ""
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        """Total number of papers written, including those beyond `limit`."""
+        return self.count
+
+
+def dump_papers(papers: pd.DataFrame, filepath: Union[str, DictSink]) -> None:
     """
     Receives a pd.DataFrame, one paper per row and dumps it into a .jsonl
     file with one paper per line.
 
     Args:
         papers (pd.DataFrame): A dataframe of paper metadata, one paper per row.
-        filepath (str): Path to dump the papers, has to end with `.jsonl`.
+        filepath (Union[str, DictSink]): Path to dump the papers, has to end with
+            `.jsonl`. Alternatively, a `DictSink` that collects the papers in memory.
     """
-    if not isinstance(filepath, str):
+    if not isinstance(filepath, (str, DictSink)):
         raise TypeError(f"filepath must be a string, not {type(filepath)}")
-    if not filepath.endswith(".jsonl"):
+    if isinstance(filepath, str) and not filepath.endswith(".jsonl"):
         raise ValueError("Please provide a filepath with .jsonl extension")
 
     if isinstance(papers, List) and all([isinstance(p, Dict) for p in papers]):
@@ -35,6 +113,11 @@ def dump_papers(papers: pd.DataFrame, filepath: str) -> None:
 
     paper_list = list(papers.T.to_dict().values())
 
+    if isinstance(filepath, DictSink):
+        for paper in paper_list:
+            filepath.write(json.dumps(paper) + "\n")
+        return
+
     with open(filepath, "w") as f:
         for paper in paper_list:
             f.write(json.dumps(paper) + "\n")
@@ -54,17 +137,19 @@ def get_filename_from_query(query: List[str]) -> str:
     return filename
 
 
-def load_jsonl(filepath: str) -> List[Dict[str, str]]:
+def load_jsonl(filepath: str, limit: Optional[int] = None) -> List[Dict[str, str]]:
     """
     Load data from a `.jsonl` file, i.e., a file with one dictionary per line.
 
     Args:
         filepath (str): Path to `.jsonl` file.
+        limit (int, optional): Maximal number of lines to parse. Defaults to None,
+            i.e. the whole file is loaded.
 
     Returns:
         List[Dict[str, str]]: A list of dictionaries, one per paper.
     """
 
     with open(filepath, "r") as f:
-        data = [json.loads(line) for line in f.readlines()]
+        data = [_json_loads(line) for line in islice(f, limit)]
     return data
@@ -1,7 +1,14 @@
+import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 
 from paperscraper.get_dumps import medrxiv
-from paperscraper.xrxiv.xrxiv_query import XRXivQuery
+from paperscraper.get_dumps.utils.parquet import convert_to_parquet
+from paperscraper.xrxiv import xrxiv_query
+from paperscraper.xrxiv.xrxiv_query import XRXivQuery, select_dump
 
 covid19 = ["COVID-19", "SARS-CoV-2"]
 ai = ["Artificial intelligence", "Deep learning", "Machine learning"]
@@ -21,3 +28,95 @@ class TestXRXiv:
         query = [covid19, ai, mi]
         querier.search_keywords(query, output_filepath="covid19_ai_imaging.jsonl")
         assert os.path.exists("covid19_ai_imaging.jsonl")
+
+    def test_xriv_querier_index(self, tmp_path):
+        papers = [
+            {
+                "title": "Deep learning for COVID-19 medical imaging",
+                "abstract": "Medical imaging with AI",
+            },
+            {"title": "SARS-CoV-2 proteins", "abstract": "Machine learning study"},
+            {"title": "Cell biology", "abstract": "Unrelated work"},
+        ]
+        dump_path = tmp_path / "dump.jsonl"
+        with open(dump_path, "w") as f:
+            for idx, paper in enumerate(papers):
+                paper.update(doi=f"10.1101/{idx}", authors="A", journal="medRxiv")
+                f.write(json.dumps({**paper, "date": "2020-05-01"}) + "\n")
+
+        querier = XRXivQuery(str(dump_path))
+        querier.build_index()
+        assert len(querier.search_keywords([covid19, ai, mi])) == 1
+        # Substring semantics are preserved for single tokens
+        assert len(querier.search_keywords([["covid", "prot"]])) == 2
+        assert len(querier.search_keywords(["learn"])) == 2
+        # Multi-token phrases fall back to a scan
+        assert len(querier.search_keywords(["machine learning"])) == 1
+        assert len(querier.search_keywords([ai + ["neural network"]])) == 2
+        assert len(querier.search_keywords(["nonexistent"])) == 0
+
+    def test_xriv_querier_concurrent_index(self, tmp_path):
+        dump_path = tmp_path / "dump.jsonl"
+        with open(dump_path, "w") as f:
+            for idx in range(200):
+                paper = {"title": f"COVID-19 learning {idx}", "abstract": ""}
+                paper.update(doi=f"10.1101/{idx}", authors="A", journal="medRxiv")
+                f.write(json.dumps({**paper, "date": "2020-05-01"}) + "\n")
+
+        querier = XRXivQuery(str(dump_path))
+        build_index, calls = querier._build_index, []
+
+        def slow_build_index():
+            calls.append(None)
+            time.sleep(0.2)
+            build_index()
+
+        querier._build_index = slow_build_index
+        # Searches racing the background build must neither fail nor build twice
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sizes = list(
+                executor.map(
+                    lambda _: len(querier.search_keywords([covid19, ["learning"]])),
+                    range(16),
+                )
+            )
+        assert sizes == [200] * 16
+        # Waits for the background build
+        querier.build_index()
+        assert len(calls) == 1
+        assert len(querier.search_keywords([covid19, ["learning"]])) == 200
+
+    def test_xriv_querier_parquet(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        dump_path = tmp_path / "dump.jsonl"
+        with open(dump_path, "w") as f:
+            for idx, title in enumerate(["COVID-19 imaging", "Cell biology"]):
+                paper = {"title": title, "doi": f"10.1101/{idx}", "date": "2020-05-01"}
+                paper.update(abstract="", authors="A", journal="medRxiv", category="x")
+                f.write(json.dumps(paper) + "\n")
+
+        parquet_path = convert_to_parquet(str(dump_path))
+        assert parquet_path == str(tmp_path / "dump.parquet")
+        querier = XRXivQuery(parquet_path)
+        assert not querier.errored
+        # Only the configured fields are read
+        assert "category" not in querier.df
+        papers = querier.search_keywords([covid19])
+        assert papers["doi"].tolist() == ["10.1101/0"]
+        assert papers["date"].tolist() == ["2020-05-01"]
+
+    def test_select_dump(self, tmp_path, monkeypatch):
+        dump_paths = []
+        for name in ["2024-01-01.jsonl", "2024-02-01.jsonl", "2024-02-01.parquet"]:
+            dump_paths.append(str(tmp_path / f"arxiv_{name}"))
+            with open(dump_paths[-1], "w") as f:
+                f.write("{}\n")
+        monkeypatch.setattr(xrxiv_query, "PARQUET_SUPPORT", True)
+        assert select_dump(dump_paths) == dump_paths[2]
+        # Without pyarrow, the JSONL dump is used
+        monkeypatch.setattr(xrxiv_query, "PARQUET_SUPPORT", False)
+        assert select_dump(dump_paths) == dump_paths[1]
+        assert select_dump(dump_paths[2:]) is None
+        # Empty dumps are skipped
+        open(dump_paths[1], "w").close()
+        assert select_dump(dump_paths) == dump_paths[0]
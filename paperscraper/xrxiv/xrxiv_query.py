@@ -1,14 +1,57 @@
 """Query dumps from bioRxiv and medRXiv."""
 
+import functools
+import importlib.util
 import logging
+import os
+import re
 import sys
-from typing import List, Union
+import threading
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Only the title and abstract are indexed, other fields are scanned
+INDEXED_FIELDS = ("title", "abstract")
+# Tokens are ASCII word characters of the lowercased text
+TOKEN_PATTERN = re.compile(r"[0-9a-z_]+")
+SEPARATOR_PATTERN = r"[^0-9a-z_]+"
+# Parquet dumps can only be read with pyarrow
+PARQUET_SUPPORT = importlib.util.find_spec("pyarrow") is not None
+
+
+def select_dump(dump_paths: List[str]) -> Optional[str]:
+    """
+    Select the most recent of several dumps. Its Parquet copy is preferred since
+    it loads much faster, but only if `pyarrow` is installed to read it. Empty
+    dumps (e.g. when the API was down) are skipped.
+
+    Args:
+        dump_paths (List[str]): Paths to `.jsonl` and `.parquet` dumps, named with
+            their date, e.g. `biorxiv_2024-01-01.jsonl`.
+
+    Returns:
+        Optional[str]: Path to the selected dump or None if none can be read.
+    """
+    if not PARQUET_SUPPORT:
+        dump_paths = [p for p in dump_paths if not p.endswith(".parquet")]
+    dump_paths = [p for p in dump_paths if os.path.getsize(p) > 0]
+    if not dump_paths:
+        return None
+    return max(
+        dump_paths, key=lambda p: (os.path.splitext(p)[0], p.endswith(".parquet"))
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_vocabulary_lookup(synonyms: Tuple[str, ...]) -> re.Pattern:
+    """Compile a pattern matching every vocabulary line containing a synonym."""
+    return re.compile(rf"^.*(?:{'|'.join(map(re.escape, synonyms))}).*$", re.MULTILINE)
+
 
 class XRXivQuery:
     """Query class."""
@@ -22,16 +65,25 @@ class XRXivQuery:
         Initialize the query class.
 
         Args:
-            dump_filepath (str): filepath to the dump to be queried.
+            dump_filepath (str): filepath to the dump to be queried, either `.jsonl`
+                or `.parquet` (requires `pyarrow`).
             fields (List[str], optional): fields to contained in the dump per paper.
                 Defaults to ['title', 'doi', 'authors', 'abstract', 'date', 'journal'].
         """
         self.dump_filepath = dump_filepath
         self.fields = fields
         self.errored = False
+        self._postings: Dict[str, Dict[str, np.ndarray]] = None
+        self._vocabularies: Dict[str, str] = None
+        self._index_lock = threading.Lock()
+        self._index_started = False
+        self._texts: Dict[str, pd.Series] = {}
 
         try:
-            self.df = pd.read_json(self.dump_filepath, lines=True)
+            if self.dump_filepath.endswith(".parquet"):
+                self.df = self._read_parquet()
+            else:
+                self.df = pd.read_json(self.dump_filepath, lines=True)
             self.df["date"] = [date.strftime("%Y-%m-%d") for date in self.df["date"]]
         except ValueError as e:
             logger.warning(f"Problem in reading file {dump_filepath}: {e} - Skipping!")
@@ -40,6 +92,168 @@ class XRXivQuery:
             logger.warning(f"Key {e} missing in file from {dump_filepath} - Skipping!")
             self.errored = True
 
+    def _read_parquet(self) -> pd.DataFrame:
+        """Read only the configured fields from a Parquet dump."""
+        # Imported lazily, pyarrow is slow to import and only needed here
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("pyarrow is required to read Parquet dumps") from None
+        available = set(pq.read_schema(self.dump_filepath).names)
+        columns = [field for field in self.fields if field in available]
+        return pd.read_parquet(self.dump_filepath, columns=columns, engine="pyarrow")
+
+    def build_index(self, background: bool = False) -> None:
+        """
+        Build an inverted token index over the title and abstract of the dump.
+
+        The lowercased text of each indexed field is split into word tokens and
+        each token is mapped to the sorted row indices it occurs in.
+        Keyword searches then resolve through set operations on these postings
+        instead of scanning the full dataframe. Other fields, e.g. DOIs or
+        authors whose tokens are nearly unique, are scanned instead.
+        The index is only built once, concurrent calls wait for it. Unless built
+        explicitly, the first search starts building it in the background and
+        searches scan the dataframe until it is ready.
+
+        Args:
+            background (bool, optional): Build in a daemon thread and return
+                immediately. Defaults to False.
+        """
+        if background:
+            threading.Thread(target=self.build_index, daemon=True).start()
+            return
+        with self._index_lock:
+            if self._postings is None:
+                self._build_index()
+
+    def _build_index(self) -> None:
+        """Build the index into local dicts, then publish them."""
+        all_postings, vocabularies = {}, {}
+        n_rows = len(self.df)
+        for field in INDEXED_FIELDS:
+            if field not in self.fields or field not in self.df or not n_rows:
+                continue
+            texts = self._field_texts(field).reset_index(drop=True)
+            tokens = texts.str.split(SEPARATOR_PATTERN, regex=True).explode()
+            codes, vocabulary = pd.factorize(tokens)
+            # Unique (token, row) pairs sorted by token, then by row
+            keys = codes.astype(np.int64) * n_rows + tokens.index.to_numpy()
+            keys = np.sort(keys[codes >= 0])
+            keys = keys[np.r_[True, np.diff(keys) != 0]]
+            codes, rows = np.divmod(keys, n_rows)
+            bounds = np.flatnonzero(np.diff(codes)) + 1
+            postings = dict(
+                zip(
+                    vocabulary[codes[np.r_[0, bounds]]],
+                    np.split(rows.astype(np.int32), bounds),
+                )
+            )
+            postings.pop("", None)
+            all_postings[field] = postings
+            # Newline-separated vocabulary to resolve substring matches in one scan
+            vocabularies[field] = "\n".join(postings)
+        # Searches check for the postings, so the vocabularies are set first
+        self._vocabularies = vocabularies
+        self._postings = all_postings
+
+    def _lookup(self, field: str, synonyms: Tuple[str, ...]) -> np.ndarray:
+        """
+        Get the rows whose field contains any single-token synonym as a substring.
+
+        Args:
+            field (str): indexed field to look up.
+            synonyms (Tuple[str, ...]): lowercased synonyms consisting of word
+                characters only.
+
+        Returns:
+            np.ndarray: Sorted row indices.
+        """
+        pattern = _compile_vocabulary_lookup(synonyms)
+        tokens = pattern.findall(self._vocabularies[field])
+        if not tokens:
+            return np.empty(0, dtype=np.int64)
+        postings = self._postings[field]
+        return np.unique(np.concatenate([postings[token] for token in tokens]))
+
+    def _field_texts(self, field: str) -> pd.Series:
+        """
+        Get the lowercased values of a field, cached across searches.
+
+        Args:
+            field (str): field of the dump.
+
+        Returns:
+            pd.Series: One string per row, empty for missing values.
+        """
+        if field not in self._texts:
+            self._texts[field] = self.df[field].str.lower().fillna("")
+        return self._texts[field]
+
+    def _scan(
+        self, field: str, synonyms: Tuple[str, ...], candidates: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Get the rows whose field matches any synonym by scanning the raw text.
+
+        Args:
+            field (str): field to be scanned.
+            synonyms (Tuple[str, ...]): lowercased synonyms, OR separated.
+            candidates (np.ndarray, optional): sorted row indices to restrict the
+                scan to. Defaults to None, a.k.a. scan all rows.
+
+        Returns:
+            np.ndarray: Sorted row indices.
+        """
+        texts = self._field_texts(field)
+        if candidates is None:
+            candidates = np.arange(len(texts))
+        else:
+            texts = texts.iloc[candidates]
+        # Vectorized, the regex runs in C++ for pyarrow-backed strings
+        mask = texts.str.contains("|".join(synonyms), na=False).to_numpy(dtype=bool)
+        return candidates[mask]
+
+    def _search_field(
+        self, field: str, keywords: List[Union[str, List[str]]]
+    ) -> np.ndarray:
+        """
+        Get the rows in which a single field matches all keywords.
+
+        Args:
+            field (str): field to be searched.
+            keywords (List[str, List[str]]): Items will be AND separated. If items
+                are lists themselves, they will be OR separated.
+
+        Returns:
+            np.ndarray: Sorted row indices.
+        """
+        hits, scans = None, []
+        for keyword in keywords:
+            synonyms = keyword if isinstance(keyword, list) else [keyword]
+            synonyms = tuple(_.lower() for _ in synonyms)
+            if (
+                self._postings is not None
+                and field in self._postings
+                and all(TOKEN_PATTERN.fullmatch(synonym) for synonym in synonyms)
+            ):
+                keyword_hits = self._lookup(field, synonyms)
+                hits = (
+                    keyword_hits if hits is None else np.intersect1d(hits, keyword_hits)
+                )
+                if not len(hits):
+                    return hits
+            else:
+                scans.append(synonyms)
+
+        # Phrases and patterns spanning several tokens need a scan of the text,
+        # restricted to the rows that survived the index lookups
+        for synonyms in scans:
+            hits = self._scan(field, synonyms, hits)
+            if not len(hits):
+                break
+        return hits
+
     def search_keywords(
         self,
         keywords: List[Union[str, List[str]]],
@@ -60,28 +274,18 @@ class XRXivQuery:
         Returns:
             pd.DataFrame: A dataframe with one paper per row.
         """
+        if self._postings is None and not self._index_started:
+            self._index_started = True
+            self.build_index(background=True)
         if fields is None:
             fields = self.fields
         fields = [field for field in fields if field != "date"]
-        hits_per_field = []
+        hits = np.empty(0, dtype=np.int64)
         for field in fields:
-            field_data = self.df[field].str.lower()
-            hits_per_keyword = []
-            for keyword in keywords:
-                if isinstance(keyword, list):
-                    query = "|".join([_.lower() for _ in keyword])
-                else:
-                    query = keyword.lower()
-                hits_per_keyword.append(field_data.str.contains(query))
-            if len(hits_per_keyword):
-                keyword_hits = hits_per_keyword[0]
-                for single_keyword_hits in hits_per_keyword[1:]:
-                    keyword_hits &= single_keyword_hits
-                hits_per_field.append(keyword_hits)
-        if len(hits_per_field):
-            hits = hits_per_field[0]
-            for single_hits in hits_per_field[1:]:
-                hits |= single_hits
+            field_hits = self._search_field(field, keywords)
+            if field_hits is not None:
+                hits = np.union1d(hits, field_hits)
+        papers = self.df.iloc[hits]
         if output_filepath is not None:
-            self.df[hits].to_json(output_filepath, orient="records", lines=True)
-        return self.df[hits]
+            papers.to_json(output_filepath, orient="records", lines=True)
+        return papers
@@ -12,33 +12,30 @@ import warnings
 os.environ['PAPERSCRAPER_MCP_MODE'] = '1'
 os.environ['PYTHONWARNINGS'] = 'ignore::DeprecationWarning'
 
-# Override warning system completely
-def warn(*args, **kwargs):
-    pass
+# Ignore all warnings; the filter is checked in C before any warning is built
+warnings.simplefilter('ignore')
 
-warnings.warn = warn
-warnings.warn_explicit = warn
-warnings.filterwarnings('ignore')
-
-# Step 2: Redirect stderr temporarily during imports
-import io
-_real_stderr = sys.stderr
-sys.stderr = io.StringIO()
+# Step 2: Run the server; paperscraper is only imported once we know we run
+if __name__ == "__main__":
+    import importlib
 
-try:
-    # Step 3: Now import with stderr captured
-    import asyncio
-    from paperscraper.mcp_server import main
-finally:
-    # Step 4: Restore stderr for debugging
-    sys.stderr = _real_stderr
+    # Step 3: Import with stderr discarded, it is restored afterwards for debugging.
+    # fd 2 itself is swapped, so C extensions writing to it directly are silenced too
+    saved_stderr_fd = os.dup(2)
+    devnull_fd = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull_fd, 2)
+    try:
+        mcp_server = importlib.import_module("paperscraper.mcp_server")
+    finally:
+        sys.stderr.flush()
+        os.dup2(saved_stderr_fd, 2)
+        os.close(saved_stderr_fd)
+        os.close(devnull_fd)
 
-# Step 5: Run the server
-if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        mcp_server.run(mcp_server.main())
     except KeyboardInterrupt:
         pass
     except Exception as e:
         print(f"Fatal error: {e}", file=sys.stderr)
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
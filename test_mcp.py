@@ -3,19 +3,84 @@
 Test script for paperscraper MCP server functionality
 """
 
+import ast
 import asyncio
-import json
+import functools
+import importlib
+import re
 import sys
-from typing import Any, Dict
+from pathlib import Path
 
-def test_paperscraper_functionality():
-    """Test core paperscraper functionality without MCP."""
-    print("Testing core paperscraper functionality...")
+PROJECT_NAME_PATTERN = re.compile(rb'(?m)^\s*name\s*=\s*"paperscraper"\s*$')
+
+REQUIRED_COMPONENTS = frozenset({
+    "async def handle_list_tools",
+    "async def handle_call_tool",
+    "search_pubmed",
+    "search_arxiv",
+    "search_scholar",
+    "get_citations",
+    "search_journal_impact"
+})
+
+@functools.lru_cache(maxsize=None)
+def _read_source(path: str) -> bytes:
+    """Read a file once; the checks only need its raw bytes."""
+    return Path(path).read_bytes()
+
+def _code_components(content: bytes) -> set:
+    """Collect the async function definitions and string literals of a module."""
+    found = set()
+    for node in ast.walk(ast.parse(content)):
+        if isinstance(node, ast.AsyncFunctionDef):
+            found.add(f"async def {node.name}")
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            found.add(node.value)
+    return found
+
+async def test_all():
+    """
+    Test imports, core functionality and the MCP server structure in one pass,
+    so paperscraper is only imported once.
+    """
+    print("Testing paperscraper imports...")
+    
+    try:
+        import paperscraper
+        print(f"✓ Paperscraper imported successfully (version {paperscraper.__version__})")
+    except ImportError as e:
+        print(f"✗ Paperscraper import failed: {e}")
+        print("\nPlease install required dependencies.")
+        return False
+    
+    print("\nTesting core paperscraper functionality...")
+    
+    # The submodules are independent, so import them concurrently
+    modules = [
+        ("paperscraper.impact", "Impactor", "Impact factor"),
+        ("paperscraper.citations", "get_citations_from_title", "Citation"),
+        ("paperscraper.arxiv", "get_and_dump_arxiv_papers", "ArXiv"),
+        ("paperscraper.pubmed", "get_and_dump_pubmed_papers", "PubMed"),
+    ]
+    loop = asyncio.get_running_loop()
+    imported = await asyncio.gather(
+        *[loop.run_in_executor(None, importlib.import_module, name) for name, _, _ in modules],
+        return_exceptions=True
+    )
+    
+    for (_, attribute, label), module in zip(modules, imported):
+        try:
+            if isinstance(module, Exception):
+                raise module
+            getattr(module, attribute)
+            print(f"✓ {label} functionality imported successfully")
+        except Exception as e:
+            print(f"✗ {label} functionality import failed: {e}")
+            return False
     
     # Test impact factor search
     try:
-        from paperscraper.impact import Impactor
-        impactor = Impactor()
+        impactor = imported[0].Impactor()
         results = impactor.search("Nature", threshold=90)
         print(f"✓ Impact factor search successful: found {len(results)} results")
         if results:
@@ -24,114 +89,63 @@ def test_paperscraper_functionality():
         print(f"✗ Impact factor search failed: {e}")
         return False
     
-    # Test citation functionality (basic import)
-    try:
-        from paperscraper.citations import get_citations_from_title
-        print("✓ Citation functionality imported successfully")
-    except Exception as e:
-        print(f"✗ Citation functionality import failed: {e}")
-        return False
-    
-    # Test arxiv functionality (basic import)
-    try:
-        from paperscraper.arxiv import get_and_dump_arxiv_papers
-        print("✓ ArXiv functionality imported successfully")
-    except Exception as e:
-        print(f"✗ ArXiv functionality import failed: {e}")
-        return False
-    
-    # Test pubmed functionality (basic import)
-    try:
-        from paperscraper.pubmed import get_and_dump_pubmed_papers
-        print("✓ PubMed functionality imported successfully")
-    except Exception as e:
-        print(f"✗ PubMed functionality import failed: {e}")
-        return False
-    
-    return True
-
-def test_mcp_structure():
-    """Test that MCP server structure is correct without importing MCP."""
     print("\nTesting MCP server file structure...")
     
     # Check if MCP server file exists and has correct structure
     try:
-        with open("paperscraper/mcp_server.py", "r") as f:
-            content = f.read()
-        
-        # Check for key components
-        required_components = [
-            "async def handle_list_tools",
-            "async def handle_call_tool", 
-            "search_pubmed",
-            "search_arxiv",
-            "search_scholar",
-            "get_citations",
-            "search_journal_impact"
-        ]
+        content = _read_source("paperscraper/mcp_server.py")
         
-        missing = []
-        for component in required_components:
-            if component not in content:
-                missing.append(component)
+        # Check for key components; only code counts, not e.g. comments
+        missing = REQUIRED_COMPONENTS - _code_components(content)
         
         if missing:
-            print(f"✗ Missing MCP server components: {missing}")
+            print(f"✗ Missing MCP server components: {sorted(missing)}")
             return False
         
         print("✓ MCP server file has all required components")
         
         # Check for proper async structure
-        if "async def main" in content and "asyncio.run(main())" in content:
+        if b"async def main" in content and b"run(main())" in content:
             print("✓ MCP server has proper async main structure")
         else:
             print("⚠ MCP server may not have proper async structure")
         
-        return True
-        
     except FileNotFoundError:
         print("✗ MCP server file not found")
         return False
     except Exception as e:
         print(f"✗ Error checking MCP server file: {e}")
         return False
-
-def test_imports():
-    """Test that paperscraper imports work."""
-    print("Testing paperscraper imports...")
-    
-    # Test paperscraper imports
-    try:
-        import paperscraper
-        print(f"✓ Paperscraper imported successfully (version {paperscraper.__version__})")
-    except ImportError as e:
-        print(f"✗ Paperscraper import failed: {e}")
-        return False
     
     return True
 
 def test_config_files():
     """Test that configuration files are properly formatted."""
     print("\nTesting configuration files...")
+    import json
     
-    # Test pyproject.toml exists and is valid
+    # Test pyproject.toml exists and has the right project name
     try:
-        import tomllib  # Python 3.11+
-    except ImportError:
-        try:
-            import tomli as tomllib  # Fallback for older Python
-        except ImportError:
-            print("⚠ Cannot test TOML files (tomllib/tomli not available)")
-            return True
-    
-    try:
-        with open("pyproject.toml", "rb") as f:
-            config = tomllib.load(f)
-        print("✓ pyproject.toml is valid TOML")
+        content = _read_source("pyproject.toml")
         
-        # Check key fields
-        assert "project" in config
-        assert config["project"]["name"] == "paperscraper"
+        # Only the name is checked, so the document is only parsed when the
+        # plain `name = "paperscraper"` line is not found
+        if PROJECT_NAME_PATTERN.search(content) is None:
+            try:
+                import tomllib  # Python 3.11+
+            except ImportError:
+                try:
+                    import tomli as tomllib  # Fallback for older Python
+                except ImportError:
+                    print("⚠ Cannot test TOML files (tomllib/tomli not available)")
+                    return True
+            
+            config = tomllib.loads(content.decode())
+            print("✓ pyproject.toml is valid TOML")
+            
+            # Check key fields
+            assert "project" in config
+            assert config["project"]["name"] == "paperscraper"
         print("✓ pyproject.toml has required fields")
         
     except Exception as e:
@@ -140,8 +154,7 @@ def test_config_files():
     
     # Test MCP config JSON
     try:
-        with open("mcp_config.json", "r") as f:
-            mcp_config = json.load(f)
+        mcp_config = json.loads(_read_source("mcp_config.json"))
         print("✓ mcp_config.json is valid JSON")
         
         assert "mcpServers" in mcp_config
@@ -158,19 +171,9 @@ def main():
     """Run all tests."""
     print("=== Testing Paperscraper MCP Integration ===\n")
     
-    # Test imports first
-    if not test_imports():
-        print("\n✗ Import tests failed. Please install required dependencies.")
-        sys.exit(1)
-    
-    # Test core functionality
-    if not test_paperscraper_functionality():
-        print("\n✗ Core functionality tests failed.")
-        sys.exit(1)
-    
-    # Test MCP structure
-    if not test_mcp_structure():
-        print("\n✗ MCP structure tests failed.")
+    # Test imports, core functionality and MCP structure
+    if not asyncio.run(test_all()):
+        print("\n✗ Paperscraper tests failed.")
         sys.exit(1)
     
     # Test config files
@@ -1,9 +1,67 @@
 #!/usr/bin/env python3
 """Test MCP connection by sending initialize request."""
 
+import selectors
 import subprocess
-import json
 import sys
+import time
+
+# Prefer the faster orjson; both variants serialize to bytes
+try:
+    import orjson
+
+    def dumps(obj, indent=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    loads = orjson.loads
+except ImportError:
+    import json
+
+    def dumps(obj, indent=False):
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+    loads = json.loads
+
+# Seconds to wait for the server's response, including its startup
+TIMEOUT = 30.0
+
+
+def read_frame(proc, stdout_buffer, stderr_buffer, timeout=TIMEOUT):
+    """
+    Wait for the next newline-terminated JSON-RPC frame on the server's stdout.
+
+    stdout and stderr are multiplexed with a selector, so stderr is drained into
+    `stderr_buffer` while waiting and a hanging server fails after `timeout`
+    instead of blocking. Bytes read past the frame stay in `stdout_buffer` for
+    the next call.
+
+    Returns:
+        bytes: The frame without its trailing newline.
+    """
+    sel = selectors.DefaultSelector()
+    sel.register(proc.stdout, selectors.EVENT_READ, stdout_buffer)
+    sel.register(proc.stderr, selectors.EVENT_READ, stderr_buffer)
+    deadline = time.monotonic() + timeout
+    try:
+        while b"\n" not in stdout_buffer:
+            remaining = deadline - time.monotonic()
+            events = sel.select(timeout=remaining) if remaining > 0 else []
+            if not events:
+                raise TimeoutError(f"No response within {timeout}s")
+            for key, _ in events:
+                chunk = key.fileobj.read(4096)
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    if key.fileobj is proc.stdout:
+                        raise EOFError("Server closed stdout without a response")
+                key.data.extend(chunk)
+    finally:
+        sel.close()
+    end = stdout_buffer.index(b"\n")
+    frame = bytes(stdout_buffer[:end])
+    del stdout_buffer[: end + 1]
+    return frame
+
 
 # Send initialize request
 initialize_request = {
@@ -20,35 +78,99 @@ initialize_request = {
     }
 }
 
-# Start the MCP server
-proc = subprocess.Popen(
-    ["/Users/matthiasflo/opt/miniconda3/envs/geo-mcp-server/bin/paperscraper-mcp"],
-    stdin=subprocess.PIPE,
-    stdout=subprocess.PIPE,
-    stderr=subprocess.PIPE,
-    text=True
-)
-
-# Send request
-request_str = json.dumps(initialize_request)
-print(f"Sending: {request_str}")
-proc.stdin.write(request_str + "\n")
-proc.stdin.flush()
-
-# Read response
+SERVER_COMMAND = ["/Users/matthiasflo/opt/miniconda3/envs/geo-mcp-server/bin/paperscraper-mcp"]
+
+
+class MCPSession:
+    """
+    A single MCP server process that serves any number of JSON-RPC calls, so the
+    server startup is only paid once.
+
+    Example:
+        with MCPSession() as session:
+            session.call("tools/list")
+    """
+
+    def __init__(self, command=SERVER_COMMAND):
+        self.command = command
+        self.stderr = bytearray()
+
+    def __enter__(self):
+        self.proc = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+            # Descriptors are non-inheritable by default anyway (PEP 446), and
+            # keeping them lets CPython spawn with posix_spawn instead of fork
+            close_fds=False
+        )
+        self._id = 0
+        self._stdout = bytearray()
+        try:
+            self.initialize_response = self.call(
+                initialize_request["method"], initialize_request["params"]
+            )
+            self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        except BaseException:
+            # __exit__ is not called when __enter__ fails, so stop the server here
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        self.proc.terminate()
+        self.proc.wait()
+
+    def _send(self, *messages):
+        request = b"".join(dumps(message) + b"\n" for message in messages)
+        print(f"Sending: {request.decode().rstrip()}")
+        self.proc.stdin.write(request)
+
+    def call(self, method, params=None):
+        """Send a request and wait for its response."""
+        return self.call_many([(method, params)])[0]
+
+    def call_many(self, calls):
+        """
+        Pipeline several requests: all are written at once, then the responses
+        are collected. MCP dropped JSON-RPC batch arrays, so every request is
+        still its own frame, but only one round-trip is paid.
+
+        Args:
+            calls: (method, params) pairs.
+
+        Returns:
+            list: The responses, in the order of `calls`.
+        """
+        ids = list(range(self._id + 1, self._id + len(calls) + 1))
+        self._id = ids[-1]
+        self._send(
+            *(
+                {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+                for request_id, (method, params) in zip(ids, calls)
+            )
+        )
+        # The server may answer out of order, so match responses by id and skip
+        # notifications and requests from the server, which carry a method
+        responses = {}
+        while len(responses) < len(ids):
+            response = read_frame(self.proc, self._stdout, self.stderr)
+            print(f"Response: {response.decode()}")
+            response = loads(response)
+            if "method" not in response and response.get("id") in ids:
+                responses[response["id"]] = response
+        return [responses[request_id] for request_id in ids]
+
+session = MCPSession()
 try:
-    response = proc.stdout.readline()
-    print(f"Response: {response}")
-    
-    # Try to parse as JSON
-    if response:
-        response_data = json.loads(response)
-        print(f"Parsed response: {json.dumps(response_data, indent=2)}")
+    with session:
+        print(f"Parsed response: {dumps(session.initialize_response, indent=True).decode()}")
+
+        pong, tools = session.call_many([("ping", None), ("tools/list", None)])
+        print(f"Server provides {len(tools['result']['tools'])} tools")
 except Exception as e:
     print(f"Error: {e}")
-    stderr = proc.stderr.read()
-    if stderr:
-        print(f"Stderr: {stderr}")
-
-# Clean up
-proc.terminate()
\ No newline at end of file
+    if session.stderr:
+        print(f"Stderr: {session.stderr.decode(errors='replace')}")
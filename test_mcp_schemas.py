@@ -1,53 +1,75 @@
 #!/usr/bin/env python3
-"""Test MCP server schemas for complex types that Claude doesn't support."""
+"""Test MCP server schemas for complex types that Claude doesn't support.
+
+Run from the repository root after `pip install -e .`.
+"""
 
 import os
-import sys
-import json
+
+# Prefer the faster orjson; both variants serialize to bytes
+try:
+    import orjson
+
+    def dumps(obj, indent=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    import json
+
+    def dumps(obj, indent=False):
+        return json.dumps(obj, indent=2 if indent else None).encode()
 
 # Set environment before imports
 os.environ['PAPERSCRAPER_MCP_MODE'] = '1'
 
-# Add paperscraper to path
-sys.path.insert(0, '/Users/matthiasflo/Documents/paperscraper')
-
 # Import after setting environment
 from paperscraper.mcp_server import handle_list_tools as mcp_list_tools
 from mcp_server_standalone import handle_list_tools as standalone_list_tools
 import asyncio
+from jsonschema import Draft7Validator
 
-async def check_schemas():
-    """Check both MCP servers for problematic schemas."""
-    
-    print("Testing paperscraper/mcp_server.py:")
+# Rejects any object at any depth of a tool schema that uses anyOf/oneOf
+FORBIDDEN_KEYS_SCHEMA = {
+    "$ref": "#/definitions/node",
+    "definitions": {
+        "node": {
+            "if": {"type": "object"},
+            "then": {
+                "not": {"anyOf": [{"required": ["anyOf"]}, {"required": ["oneOf"]}]},
+                "additionalProperties": {"$ref": "#/definitions/node"},
+            },
+            "else": {"items": {"$ref": "#/definitions/node"}},
+        }
+    },
+}
+VALIDATOR = Draft7Validator(FORBIDDEN_KEYS_SCHEMA)
+
+
+def report(name, tools):
+    """Print the schema check for the tools of one server."""
+    print(f"Testing {name}:")
     print("-" * 40)
     
-    try:
-        tools = await mcp_list_tools()
-        for tool in tools:
-            schema_str = json.dumps(tool.inputSchema)
-            if 'anyOf' in schema_str or 'oneOf' in schema_str:
-                print(f"❌ {tool.name}: Has anyOf/oneOf in schema")
-                print(f"   Schema: {json.dumps(tool.inputSchema, indent=2)}")
-            else:
-                print(f"✅ {tool.name}: Schema is simple")
-    except Exception as e:
-        print(f"Error testing mcp_server.py: {e}")
-    
-    print("\nTesting mcp_server_standalone.py:")
-    print("-" * 40)
+    if isinstance(tools, Exception):
+        print(f"Error testing {name}: {tools}")
+        return
+    for tool in tools:
+        if not VALIDATOR.is_valid(tool.inputSchema):
+            print(f"❌ {tool.name}: Has anyOf/oneOf in schema")
+            print(f"   Schema: {dumps(tool.inputSchema, indent=True).decode()}")
+        else:
+            print(f"✅ {tool.name}: Schema is simple")
+
+
+async def check_schemas():
+    """Check both MCP servers for problematic schemas."""
     
-    try:
-        tools = await standalone_list_tools()
-        for tool in tools:
-            schema_str = json.dumps(tool.inputSchema)
-            if 'anyOf' in schema_str or 'oneOf' in schema_str:
-                print(f"❌ {tool.name}: Has anyOf/oneOf in schema")
-                print(f"   Schema: {json.dumps(tool.inputSchema, indent=2)}")
-            else:
-                print(f"✅ {tool.name}: Schema is simple")
-    except Exception as e:
-        print(f"Error testing mcp_server_standalone.py: {e}")
+    # Both servers are independent, so list their tools concurrently
+    mcp_tools, standalone_tools = await asyncio.gather(
+        mcp_list_tools(), standalone_list_tools(), return_exceptions=True
+    )
+    report("paperscraper/mcp_server.py", mcp_tools)
+    print()
+    report("mcp_server_standalone.py", standalone_tools)
 
 if __name__ == "__main__":
     asyncio.run(check_schemas())
\ No newline at end of file